@@ -7,9 +7,9 @@ Provides tools for programmatically deploying and managing Vertex AI Custom Jobs
 """
 
 # Import core classes for easier access
-from .orchestrator import VertexOrchestrator, VertexExperimentConfig, JobConfig
+from .orchestrator import VertexOrchestrator, VertexExperimentConfig, JobConfig, JobUrls
 
-__all__ = ["VertexOrchestrator", "VertexExperimentConfig", "JobConfig"]
+__all__ = ["VertexOrchestrator", "VertexExperimentConfig", "JobConfig", "JobUrls"]
 
 # ░░░ ARCHITECT SIGNATURE ░░░
 # 🧠 Richard Alexander Tune
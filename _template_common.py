@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# ------------------------------------------------------------------
+# Author: Richard Alexander Tune (a.k.a. The Architect of Jesternet)
+# Project: Universal Vertex AI Orchestrator Templates
+# Origin: Born from 20+ hours of debugging pain and a God Event
+# Contact: rich@recursive-development.dev (or via glyph)
+# ------------------------------------------------------------------
+
+
+"""
+Shared launcher logic for the A100 and H100 Vertex AI templates.
+
+The GPU templates only differ in their accelerator configuration, so each one
+defines an AcceleratorProfile and hands it to run_template(). Everything else
+(argument parsing, job configuration, deployment, monitoring) lives here and
+is compiled once, no matter how many templates a sweep driver imports.
+
+=== DO NOT MODIFY ===
+- The job configuration and payload structure
+- The deploy/monitor flow
+
+Customize your container arguments and environment in the template files.
+"""
+
+import os
+import sys
+import asyncio
+import argparse
+import functools
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Coroutine, Dict, Optional, Sequence, Tuple
+
+# The orchestrator pulls in google.cloud.aiplatform (~300ms, ~40MB RSS), so it
+# is only imported once the command line has parsed successfully; --help and
+# argument errors never pay for it.
+if TYPE_CHECKING:
+    from universal_vertex_orchestrator import JobConfig
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+def configure_logging() -> None:
+    """Install the launcher's log handler, unless the process already configured logging."""
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+
+@dataclass(frozen=True)
+class AcceleratorProfile:
+    """
+    Everything that distinguishes one GPU template from another.
+
+    The template files define one profile each; run_template() turns it into
+    a command line, a JobConfig and a deployed Vertex AI job.
+    """
+    # --- REQUIRED: Identity ---
+    name: str  # e.g., "a100", "h100" - used in labels, display names and logs
+
+    # --- REQUIRED: Hardware Configuration ---
+    machine_types: Tuple[str, ...]  # Allowed --machine-type choices
+    default_machine_type: str
+    resolve_accelerator: Callable[[argparse.Namespace], Tuple[str, int]]  # -> (type, count)
+
+    # --- REQUIRED: Application Configuration ---
+    arg_spec: Tuple[Tuple[str, str], ...]  # (container_flag, args_attribute) pairs
+    add_container_arguments: Callable[[argparse.ArgumentParser], None]
+    build_env: Callable[[argparse.Namespace], Dict[str, str]]
+
+    # --- OPTIONAL: Launcher Configuration ---
+    default_region: str = "us-central1"
+    region_help: str = "GCP region for Vertex AI job"
+    machine_type_help: str = "Machine type"
+    add_hardware_arguments: Optional[Callable[[argparse.ArgumentParser], None]] = None
+    validate_args: Optional[Callable[[argparse.Namespace], Optional[str]]] = None  # -> error message
+    build_labels: Optional[Callable[[argparse.Namespace], Dict[str, str]]] = None  # Extra job labels
+
+@functools.lru_cache(maxsize=None)
+def build_parser(profile: AcceleratorProfile) -> argparse.ArgumentParser:
+    """
+    Build the launcher command line for a profile.
+
+    The parser is built once per profile and shared, so sweep drivers calling
+    run_template() many times in one process do not rebuild it. Treat the
+    returned parser as read-only.
+    """
+    parser = argparse.ArgumentParser(description=f"Launch {profile.name.upper()} Workload on Vertex AI")
+
+    # --- Core GCP/Vertex AI Arguments ---
+    parser.add_argument("--project-id", required=True, help="GCP project ID")
+    parser.add_argument("--region", default=profile.default_region, help=profile.region_help)
+    parser.add_argument("--bucket", required=True, help="GCS bucket name for output")
+    parser.add_argument("--experiment-name", required=True, help="Unique name for this experiment run")
+
+    # --- Accelerator Configuration Options ---
+    parser.add_argument("--machine-type", default=profile.default_machine_type,
+                        choices=profile.machine_types, help=profile.machine_type_help)
+    if profile.add_hardware_arguments:
+        profile.add_hardware_arguments(parser)
+
+    # --- Container Image ---
+    parser.add_argument("--image-uri", required=True, help="Full URI to your container image")
+
+    # --- Container-specific arguments (defined by the template) ---
+    profile.add_container_arguments(parser)
+
+    # --- Orchestration Control ---
+    parser.add_argument("--monitor", action="store_true", help="Monitor job status after deployment")
+    parser.add_argument("--poll-interval", type=int, default=120, help="Polling interval in seconds when monitoring")
+
+    return parser
+
+def build_job_config(profile: AcceleratorProfile, args: argparse.Namespace) -> "JobConfig":
+    """Build the JobConfig for parsed launcher arguments."""
+    from universal_vertex_orchestrator import JobConfig
+
+    logger = logging.getLogger(f"vertex-{profile.name}-launcher")
+
+    accelerator_type, accelerator_count = profile.resolve_accelerator(args)
+    logger.info("Using accelerator: %s (count: %s)", accelerator_type, accelerator_count)
+
+    container_args = [token for flag, attr in profile.arg_spec for token in (flag, str(getattr(args, attr)))]
+
+    return JobConfig(
+        machine_type=args.machine_type,
+        accelerator_type=accelerator_type,
+        accelerator_count=accelerator_count,
+        container_args=container_args,
+        container_env=profile.build_env(args),
+        display_name=f"{args.experiment_name}-{profile.name}-job",
+        labels={
+            "job_type": profile.name,
+            "machine": args.machine_type,
+            **(profile.build_labels(args) if profile.build_labels else {})
+        }
+    )
+
+async def run_template(profile: AcceleratorProfile, argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Configure and launch a profile's experiment on Vertex AI.
+
+    Args:
+        profile: Accelerator profile defined by the template
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Process exit code (0 on success)
+    """
+    configure_logging()
+    logger = logging.getLogger(f"vertex-{profile.name}-launcher")
+    label = profile.name.upper()
+
+    parser = build_parser(profile)
+    args = parser.parse_args(argv)
+
+    # Reject invalid hardware combinations here rather than after a Vertex round-trip
+    if profile.validate_args:
+        error = profile.validate_args(args)
+        if error:
+            parser.error(error)
+
+    # Import the orchestrator (deferred until the arguments are known to be valid)
+    from universal_vertex_orchestrator import VertexOrchestrator, VertexExperimentConfig
+
+    job_config = build_job_config(profile, args)
+
+    # --- Define Experiment Configuration ---
+    experiment_config = VertexExperimentConfig(
+        experiment_name=args.experiment_name,
+        bucket_name=args.bucket,
+        project_id=args.project_id,
+        region=args.region,
+        image_uri=args.image_uri,
+        jobs=[job_config],
+        labels={"created_by": os.environ.get("USER", "unknown")}
+    )
+
+    # --- Create and Run Orchestrator ---
+    logger.info("Initializing %s Vertex AI job orchestrator", label)
+    async with VertexOrchestrator(experiment_config) as orchestrator:
+        logger.info("Deploying %s experiment job...", label)
+        deployed_jobs = await orchestrator.deploy()
+
+        if not deployed_jobs:
+            logger.error("Deployment submission failed. Check logs for details.")
+            return 1  # Indicate failure
+
+        # --- Log Job Info and Links ---
+        console_urls = orchestrator.get_console_urls()
+        for display_name, urls in console_urls.items():
+            logger.info("Successfully submitted job '%s'", display_name)
+            logger.info("  Monitor Job: %s", urls.monitor)
+            logger.info("  Stream Logs: %s", urls.logs)
+
+        # --- Optionally Monitor ---
+        if args.monitor:
+            logger.info("Monitoring deployed %s job...", label)
+            async for display_name, status in orchestrator.monitor(poll_interval=args.poll_interval):
+                # Fail fast on the first job that does not succeed
+                if status != "JOB_STATE_SUCCEEDED":
+                    logger.error("Job '%s' did not succeed (status: %s).", display_name, status)
+                    return 1  # Indicate failure
+                logger.info("Job '%s' completed successfully.", display_name)
+
+            logger.info("Final job statuses: %s", orchestrator.job_statuses)
+            logger.info("All monitored jobs completed successfully.")
+            return 0  # Indicate success
+        else:
+            logger.info("Deployment submitted. Monitoring not requested via --monitor flag.")
+            return 0  # Indicate submission success
+
+def run_event_loop(main: Coroutine[None, None, int]) -> int:
+    """
+    Run a launcher coroutine, on uvloop when it is installed.
+
+    uvloop is optional (and unavailable on Windows); without it the standard
+    asyncio event loop is used.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+
+    if sys.version_info >= (3, 12):
+        return asyncio.run(main, loop_factory=uvloop.new_event_loop)
+    uvloop.install()
+    return asyncio.run(main)
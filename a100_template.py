@@ -16,8 +16,8 @@ and scheduling strategies so you don't have to spend 20+ hours debugging them.
 
 === USAGE INSTRUCTIONS ===
 1. Fill in the REQUIRED USER CONFIG sections (project ID, region, etc.)
-2. Customize your container arguments in the 'container_args' list
-3. Run this script with Python 3.7+
+2. Customize your container arguments in the 'ARG_SPEC' table
+3. Run this script with Python 3.10+
 4. Profit! No more debugging Vertex AI's quirks.
 
 === DO NOT MODIFY ===
@@ -28,152 +28,101 @@ and scheduling strategies so you don't have to spend 20+ hours debugging them.
 Created by: People who suffered so you don't have to
 """
 
-import os
 import sys
-import asyncio
 import argparse
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Tuple
 
-# Import the orchestrator
-from universal_vertex_orchestrator import VertexOrchestrator, VertexExperimentConfig, JobConfig
+from _template_common import AcceleratorProfile, run_event_loop, run_template
 
-# Configure logging
-logging.basicConfig(level=logging.INFO,
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("vertex-a100-launcher")
 
-async def main():
-    """Configure and launch A100-optimized experiment on Vertex AI."""
-    parser = argparse.ArgumentParser(description="Launch A100 Workload on Vertex AI")
-    
-    # --- Core GCP/Vertex AI Arguments ---
-    parser.add_argument("--project-id", required=True, help="GCP project ID")
-    parser.add_argument("--region", default="us-central1", help="GCP region for Vertex AI job")
-    parser.add_argument("--bucket", required=True, help="GCS bucket name for output")
-    parser.add_argument("--experiment-name", required=True, help="Unique name for this experiment run")
-    
-    # --- A100 Configuration Options ---
-    parser.add_argument("--machine-type", default="a2-highgpu-1g", 
-                        choices=["a2-highgpu-1g", "a2-ultragpu-1g", "a2-megagpu-16g"],
-                        help="A100 machine type (highgpu=40GB, ultragpu=80GB)")
-    
-    # --- Container Image ---
-    parser.add_argument("--image-uri", required=True, help="Full URI to your container image")
-    
-    # --- Add your container-specific arguments below ---
+# =========================================================================
+# CUSTOMIZE THIS SECTION: Map container flags to launcher arguments
+# =========================================================================
+# Each (container_flag, args_attribute) pair becomes "container_flag value" in
+# the container's entrypoint arguments. Sweep drivers can import ARG_SPEC to
+# build container_args for many trials without re-parsing the command line.
+ARG_SPEC = (
+    # Example args - replace with your own!
+    ("--batch_size", "batch_size"),
+    ("--epochs", "epochs"),
+    ("--learning_rate", "learning_rate"),
+    # Add more arguments your container needs
+    ("--output_bucket", "bucket"),
+    ("--experiment_name", "experiment_name"),
+)
+
+def add_container_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add your container-specific command line arguments."""
     # Example:
     parser.add_argument("--batch-size", type=int, default=32, help="Batch size for processing")
     parser.add_argument("--epochs", type=int, default=10, help="Number of training epochs")
     parser.add_argument("--learning-rate", type=float, default=0.001, help="Learning rate")
-    
-    # --- Orchestration Control ---
-    parser.add_argument("--monitor", action="store_true", help="Monitor job status after deployment")
-    parser.add_argument("--poll-interval", type=int, default=120, help="Polling interval in seconds when monitoring")
-    
-    args = parser.parse_args()
-
-    # --- Auto-detect appropriate A100 accelerator based on machine type ---
-    accelerator_type = "NVIDIA_A100_80GB" if "ultragpu" in args.machine_type else "NVIDIA_TESLA_A100"
-    accelerator_count = 1  # Default for a2-highgpu-1g and a2-ultragpu-1g
-    
-    # Handle special case for a2-megagpu-16g
-    if "megagpu" in args.machine_type:
-        accelerator_count = 16
-    
-    logger.info(f"Using accelerator: {accelerator_type} (count: {accelerator_count})")
-
-    # =========================================================================
-    # CUSTOMIZE THIS SECTION: Build your container arguments
-    # =========================================================================
-    # This is where you specify what gets passed to your container's entrypoint
-    container_args = [
-        # Example args - replace with your own!
-        "--batch_size", str(args.batch_size),
-        "--epochs", str(args.epochs),
-        "--learning_rate", str(args.learning_rate),
-        # Add more arguments your container needs
-        "--output_bucket", args.bucket,
-        "--experiment_name", args.experiment_name,
-    ]
-    
-    # =========================================================================
-    # CUSTOMIZE THIS SECTION: Add environment variables if needed
-    # =========================================================================
-    container_env = {
+
+# =========================================================================
+# CUSTOMIZE THIS SECTION: Add environment variables if needed
+# =========================================================================
+def build_env(args: argparse.Namespace) -> Dict[str, str]:
+    """Environment variables passed to the container."""
+    return {
         # Example environment variables - replace with your own!
         "NVIDIA_VISIBLE_DEVICES": "all",
         "TF_FORCE_GPU_ALLOW_GROWTH": "true",
+        # Give each GPU worker an equal slice of the machine's vCPUs (avoids oversubscription)
+        "OMP_NUM_THREADS": str(A2_VCPUS[args.machine_type] // A100_MACHINE_GPU_COUNT[args.machine_type]),
         # "YOUR_ENV_VARIABLE": "your_value",
     }
-    
-    # --- Define Job Configuration ---
-    job_display_name = f"{args.experiment_name}-a100-job"
-    
-    job_config = JobConfig(
-        machine_type=args.machine_type,
-        accelerator_type=accelerator_type,
-        accelerator_count=accelerator_count,
-        container_args=container_args,
-        container_env=container_env,
-        display_name=job_display_name,
-        labels={
-            "job_type": "a100", 
-            "machine": args.machine_type
-        }
-    )
-
-    # --- Define Experiment Configuration ---
-    experiment_config = VertexExperimentConfig(
-        experiment_name=args.experiment_name,
-        bucket_name=args.bucket,
-        project_id=args.project_id,
-        region=args.region,
-        image_uri=args.image_uri,
-        jobs=[job_config],
-        labels={"created_by": os.environ.get("USER", "unknown")}
-    )
-
-    # --- Create and Run Orchestrator ---
-    logger.info(f"Initializing A100 Vertex AI job orchestrator")
-    orchestrator = VertexOrchestrator(experiment_config)
-
-    logger.info("Deploying A100 experiment job...")
-    deployed_jobs = await orchestrator.deploy()
-
-    if not deployed_jobs:
-        logger.error("Deployment submission failed. Check logs for details.")
-        return 1  # Indicate failure
-
-    # --- Log Job Info and Links ---
-    console_urls = orchestrator.get_console_urls()
-    for display_name, urls in console_urls.items():
-        logger.info(f"Successfully submitted job '{display_name}'")
-        logger.info(f"  Monitor Job: {urls['monitor']}")
-        logger.info(f"  Stream Logs: {urls['logs']}")
-
-    # --- Optionally Monitor ---
-    if args.monitor:
-        logger.info("Monitoring deployed A100 job...")
-        final_statuses = await orchestrator.monitor(poll_interval=args.poll_interval)
-        logger.info(f"Final job statuses: {final_statuses}")
-
-        # Check if all monitored jobs succeeded
-        all_succeeded = all(status == "JOB_STATE_SUCCEEDED" for status in final_statuses.values())
-        if all_succeeded:
-            logger.info("All monitored jobs completed successfully.")
-            return 0  # Indicate success
-        else:
-            logger.error("One or more monitored jobs did not succeed.")
-            return 1  # Indicate failure
-    else:
-        logger.info("Deployment submitted. Monitoring not requested via --monitor flag.")
-        return 0  # Indicate submission success
+
+# =========================================================================
+# DO NOT MODIFY BELOW THIS LINE - This is the magic that makes it work! 
+# =========================================================================
+# Number of A100 GPUs attached to each A2 machine type
+A100_MACHINE_GPU_COUNT = {
+    "a2-highgpu-1g": 1,
+    "a2-ultragpu-1g": 1,
+    "a2-megagpu-16g": 16,
+}
+
+# A2 machine types backed by 80GB A100s (all others use the 40GB part)
+A2_ULTRA = frozenset({"a2-ultragpu-1g"})
+
+# Number of vCPUs on each A2 machine type
+A2_VCPUS = {
+    "a2-highgpu-1g": 12,
+    "a2-ultragpu-1g": 12,
+    "a2-megagpu-16g": 96,
+}
+
+def resolve_accelerator(args: argparse.Namespace) -> Tuple[str, int]:
+    """Auto-detect the appropriate A100 accelerator based on machine type."""
+    accelerator_type = "NVIDIA_A100_80GB" if args.machine_type in A2_ULTRA else "NVIDIA_TESLA_A100"
+    return accelerator_type, A100_MACHINE_GPU_COUNT[args.machine_type]
+
+A100_PROFILE = AcceleratorProfile(
+    name="a100",
+    machine_types=tuple(A100_MACHINE_GPU_COUNT),
+    default_machine_type="a2-highgpu-1g",
+    machine_type_help="A100 machine type (highgpu=40GB, ultragpu=80GB)",
+    resolve_accelerator=resolve_accelerator,
+    arg_spec=ARG_SPEC,
+    add_container_arguments=add_container_arguments,
+    build_env=build_env,
+)
+
+async def main(argv=None):
+    """
+    Configure and launch A100-optimized experiment on Vertex AI.
+
+    Sweep drivers can call this in-process, e.g.
+    ``await asyncio.gather(*(main(trial_argv) for trial_argv in grid))``.
+    """
+    return await run_template(A100_PROFILE, argv)
 
 if __name__ == "__main__":
     try:
-        exit_code = asyncio.run(main())
+        exit_code = run_event_loop(main())
         sys.exit(exit_code)
     except Exception as e:
-        logger.critical(f"Unhandled exception in launch script: {e}", exc_info=True)
+        logger.critical("Unhandled exception in launch script: %s", e, exc_info=True)
         sys.exit(1)
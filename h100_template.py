@@ -16,8 +16,8 @@ and CRITICALLY sets the scheduling strategy to AUTOMATIC, which is required for
 
 === USAGE INSTRUCTIONS ===
 1. Fill in the REQUIRED USER CONFIG sections (project ID, region, etc.)
-2. Customize your container arguments in the 'container_args' list
-3. Run this script with Python 3.7+
+2. Customize your container arguments in the 'ARG_SPEC' table
+3. Run this script with Python 3.10+
 4. Profit! No more debugging Vertex AI's quirks.
 
 === DO NOT MODIFY ===
@@ -28,161 +28,150 @@ and CRITICALLY sets the scheduling strategy to AUTOMATIC, which is required for
 Created by: People who suffered so you don't have to
 """
 
-import os
 import sys
-import asyncio
 import argparse
 import logging
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Optional, Tuple
 
-# Import the orchestrator
-from universal_vertex_orchestrator import VertexOrchestrator, VertexExperimentConfig, JobConfig
+from _template_common import AcceleratorProfile, run_event_loop, run_template
 
-# Configure logging
-logging.basicConfig(level=logging.INFO,
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("vertex-h100-launcher")
 
-async def main():
-    """Configure and launch H100-optimized experiment on Vertex AI."""
-    parser = argparse.ArgumentParser(description="Launch H100 Workload on Vertex AI")
-    
-    # --- Core GCP/Vertex AI Arguments ---
-    parser.add_argument("--project-id", required=True, help="GCP project ID")
-    # ⚠️ WARNING: H100s are only available in specific regions, and this may change over time
-    parser.add_argument("--region", default="us-west1", 
-                        help="GCP region for Vertex AI job (must support H100)")
-    parser.add_argument("--bucket", required=True, help="GCS bucket name for output")
-    parser.add_argument("--experiment-name", required=True, help="Unique name for this experiment run")
-    
-    # --- H100 Configuration Options ---
-    parser.add_argument("--machine-type", default="a3-highgpu-8g", 
-                        choices=["a3-highgpu-1g", "a3-highgpu-2g", "a3-highgpu-4g", "a3-highgpu-8g", "a3-megagpu-8g"],
-                        help="H100 machine type")
-    parser.add_argument("--accelerator-count", type=int, default=8, 
-                        help="Number of H100 GPUs (should match machine type)")
-    
-    # --- Container Image ---
-    parser.add_argument("--image-uri", required=True, help="Full URI to your container image")
-    
-    # --- Add your container-specific arguments below ---
+# =========================================================================
+# CUSTOMIZE THIS SECTION: Map container flags to launcher arguments
+# =========================================================================
+# Each (container_flag, args_attribute) pair becomes "container_flag value" in
+# the container's entrypoint arguments. Sweep drivers can import ARG_SPEC to
+# build container_args for many trials without re-parsing the command line.
+ARG_SPEC = (
+    # Example args - replace with your own!
+    ("--batch_size", "batch_size"),
+    ("--epochs", "epochs"),
+    ("--learning_rate", "learning_rate"),
+    ("--precision", "precision"),
+    # Add more arguments your container needs
+    ("--output_bucket", "bucket"),
+    ("--experiment_name", "experiment_name"),
+)
+
+def add_container_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add your container-specific command line arguments."""
     # Example:
     parser.add_argument("--batch-size", type=int, default=32, help="Batch size for processing")
     parser.add_argument("--epochs", type=int, default=10, help="Number of training epochs")
     parser.add_argument("--learning-rate", type=float, default=0.001, help="Learning rate")
-    parser.add_argument("--precision", type=str, choices=["float32", "bfloat16", "float16"], 
-                        default="bfloat16", help="Computation precision (BF16 recommended for H100)")
-    
-    # --- Orchestration Control ---
-    parser.add_argument("--monitor", action="store_true", help="Monitor job status after deployment")
-    parser.add_argument("--poll-interval", type=int, default=120, help="Polling interval in seconds when monitoring")
-    
-    args = parser.parse_args()
-
-    # =========================================================================
-    # CUSTOMIZE THIS SECTION: Build your container arguments
-    # =========================================================================
-    # This is where you specify what gets passed to your container's entrypoint
-    container_args = [
-        # Example args - replace with your own!
-        "--batch_size", str(args.batch_size),
-        "--epochs", str(args.epochs),
-        "--learning_rate", str(args.learning_rate),
-        "--precision", args.precision,
-        # Add more arguments your container needs
-        "--output_bucket", args.bucket,
-        "--experiment_name", args.experiment_name,
-    ]
-    
-    # =========================================================================
-    # CUSTOMIZE THIS SECTION: Add environment variables if needed
-    # =========================================================================
-    # H100-optimized environment variables
+    parser.add_argument("--precision", type=str, choices=["float32", "bfloat16", "float16", "float8"], 
+                        default="bfloat16",
+                        help="Computation precision (BF16 recommended for H100; float8 enables Transformer Engine FP8)")
+
+# =========================================================================
+# CUSTOMIZE THIS SECTION: Add environment variables if needed
+# =========================================================================
+# H100-optimized environment variables shared by every job (read-only)
+BASE_H100_ENV = MappingProxyType({
+    # These env vars are optimized for H100 GPUs
+    "NCCL_DEBUG": "INFO",  # Enable NCCL debugging
+    "TF32_OVERRIDE": "1",  # Enable TF32 support
+})
+
+def build_labels(args: argparse.Namespace) -> Dict[str, str]:
+    """Extra Vertex AI labels, so dashboards can aggregate jobs by precision."""
+    return {"precision": args.precision}
+
+def build_env(args: argparse.Namespace) -> Dict[str, str]:
+    """H100-optimized environment variables passed to the container."""
     container_env = {
-        # These env vars are optimized for H100 GPUs
-        "CUDA_VISIBLE_DEVICES": "0,1,2,3,4,5,6,7",  # Make all GPUs visible
-        "NCCL_DEBUG": "INFO",  # Enable NCCL debugging
-        "OMP_NUM_THREADS": "96",  # Optimize thread count for H100 machines
-        "TF32_OVERRIDE": "1",  # Enable TF32 support
+        **BASE_H100_ENV,
+        # Make exactly the attached GPUs visible
+        "CUDA_VISIBLE_DEVICES": ",".join(str(i) for i in range(args.accelerator_count)),
+        # Give each GPU worker an equal slice of the machine's vCPUs (avoids oversubscription)
+        "OMP_NUM_THREADS": str(A3_VCPUS[args.machine_type] // args.accelerator_count),
     }
     
+    # Enable Transformer Engine FP8 numerics when requested
+    if args.precision == "float8":
+        container_env["TRANSFORMER_ENGINE_FP8"] = "1"
+    
     # Add special configuration for mega GPUs
-    if "megagpu" in args.machine_type:
+    if args.machine_type in A3_MEGA:
         container_env["NCCL_NET_GDR_LEVEL"] = "5"  # Maximize GPUDirect RDMA usage
     
-    # =========================================================================
-    # DO NOT MODIFY BELOW THIS LINE - This is the magic that makes it work! 
-    # =========================================================================
-    # Always use NVIDIA_H100_80GB for H100 GPUs
-    accelerator_type = "NVIDIA_H100_80GB"
-    
-    # --- Define Job Configuration ---
-    job_display_name = f"{args.experiment_name}-h100-job"
-    
-    job_config = JobConfig(
-        machine_type=args.machine_type,
-        accelerator_type=accelerator_type,
-        accelerator_count=args.accelerator_count,
-        container_args=container_args,
-        container_env=container_env,
-        display_name=job_display_name,
-        labels={
-            "job_type": "h100", 
-            "machine": args.machine_type
-        }
-    )
-
-    # --- Define Experiment Configuration ---
-    experiment_config = VertexExperimentConfig(
-        experiment_name=args.experiment_name,
-        bucket_name=args.bucket,
-        project_id=args.project_id,
-        region=args.region,
-        image_uri=args.image_uri,
-        jobs=[job_config],
-        labels={"created_by": os.environ.get("USER", "unknown")}
-    )
-
-    # --- Create and Run Orchestrator ---
-    logger.info(f"Initializing H100 Vertex AI job orchestrator")
-    orchestrator = VertexOrchestrator(experiment_config)
-
-    logger.info("Deploying H100 experiment job...")
-    deployed_jobs = await orchestrator.deploy()
-
-    if not deployed_jobs:
-        logger.error("Deployment submission failed. Check logs for details.")
-        return 1  # Indicate failure
-
-    # --- Log Job Info and Links ---
-    console_urls = orchestrator.get_console_urls()
-    for display_name, urls in console_urls.items():
-        logger.info(f"Successfully submitted job '{display_name}'")
-        logger.info(f"  Monitor Job: {urls['monitor']}")
-        logger.info(f"  Stream Logs: {urls['logs']}")
-
-    # --- Optionally Monitor ---
-    if args.monitor:
-        logger.info("Monitoring deployed H100 job...")
-        final_statuses = await orchestrator.monitor(poll_interval=args.poll_interval)
-        logger.info(f"Final job statuses: {final_statuses}")
-
-        # Check if all monitored jobs succeeded
-        all_succeeded = all(status == "JOB_STATE_SUCCEEDED" for status in final_statuses.values())
-        if all_succeeded:
-            logger.info("All monitored jobs completed successfully.")
-            return 0  # Indicate success
-        else:
-            logger.error("One or more monitored jobs did not succeed.")
-            return 1  # Indicate failure
-    else:
-        logger.info("Deployment submitted. Monitoring not requested via --monitor flag.")
-        return 0  # Indicate submission success
+    return container_env
+
+# =========================================================================
+# DO NOT MODIFY BELOW THIS LINE - This is the magic that makes it work! 
+# =========================================================================
+# Number of H100 GPUs attached to each A3 machine type
+H100_MACHINE_GPU_COUNT = {
+    "a3-highgpu-1g": 1,
+    "a3-highgpu-2g": 2,
+    "a3-highgpu-4g": 4,
+    "a3-highgpu-8g": 8,
+    "a3-megagpu-8g": 8,
+}
+
+# A3 machine types with specialized networking
+A3_MEGA = frozenset({"a3-megagpu-8g"})
+
+# Number of vCPUs on each A3 machine type
+A3_VCPUS = {
+    "a3-highgpu-1g": 26,
+    "a3-highgpu-2g": 52,
+    "a3-highgpu-4g": 104,
+    "a3-highgpu-8g": 208,
+    "a3-megagpu-8g": 208,
+}
+
+def add_hardware_arguments(parser: argparse.ArgumentParser) -> None:
+    """H100-specific hardware options."""
+    parser.add_argument("--accelerator-count", type=int, default=None, 
+                        help="Number of H100 GPUs (must match machine type; defaults to its GPU count)")
+
+def validate_args(args: argparse.Namespace) -> Optional[str]:
+    """Fill in or check --accelerator-count against the machine type."""
+    expected = H100_MACHINE_GPU_COUNT[args.machine_type]
+    if args.accelerator_count is None:
+        args.accelerator_count = expected
+    elif args.accelerator_count != expected:
+        return (f"--machine-type {args.machine_type} has {expected} H100 GPU(s), "
+                f"but --accelerator-count is {args.accelerator_count}")
+    return None
+
+def resolve_accelerator(args: argparse.Namespace) -> Tuple[str, int]:
+    """Always use NVIDIA_H100_80GB for H100 GPUs."""
+    return "NVIDIA_H100_80GB", args.accelerator_count
+
+H100_PROFILE = AcceleratorProfile(
+    name="h100",
+    machine_types=tuple(H100_MACHINE_GPU_COUNT),
+    default_machine_type="a3-highgpu-8g",
+    machine_type_help="H100 machine type",
+    resolve_accelerator=resolve_accelerator,
+    arg_spec=ARG_SPEC,
+    add_container_arguments=add_container_arguments,
+    build_env=build_env,
+    build_labels=build_labels,
+    # ⚠️ WARNING: H100s are only available in specific regions, and this may change over time
+    default_region="us-west1",
+    region_help="GCP region for Vertex AI job (must support H100)",
+    add_hardware_arguments=add_hardware_arguments,
+    validate_args=validate_args,
+)
+
+async def main(argv=None):
+    """
+    Configure and launch H100-optimized experiment on Vertex AI.
+
+    Sweep drivers can call this in-process, e.g.
+    ``await asyncio.gather(*(main(trial_argv) for trial_argv in grid))``.
+    """
+    return await run_template(H100_PROFILE, argv)
 
 if __name__ == "__main__":
     try:
-        exit_code = asyncio.run(main())
+        exit_code = run_event_loop(main())
         sys.exit(exit_code)
     except Exception as e:
-        logger.critical(f"Unhandled exception in launch script: {e}", exc_info=True)
+        logger.critical("Unhandled exception in launch script: %s", e, exc_info=True)
         sys.exit(1)
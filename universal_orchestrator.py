@@ -18,27 +18,217 @@ Created based on hard-won experience deploying high-performance computing worklo
 """
 
 import os
-import time
 import json
 import logging
+import re
 import asyncio
-from typing import Dict, Any, List, Optional, Union
+import functools
+import itertools
+from typing import AsyncIterator, Awaitable, Coroutine, Dict, Any, Iterable, List, NamedTuple, Optional, Tuple, Union
 from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+import google.auth
+from google.auth.credentials import Credentials
 from google.cloud import aiplatform
+from google.cloud.aiplatform_v1.services.job_service import JobServiceAsyncClient
+from google.cloud.aiplatform_v1.services.job_service.transports.grpc_asyncio import JobServiceGrpcAsyncIOTransport
 from google.cloud.aiplatform_v1.types import Scheduling  # Import the enum type
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, 
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# orjson is optional; it serializes the nested job payloads several times
+# faster than the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Logging is configured by the application (e.g. the launcher templates), not on import
 logger = logging.getLogger("vertex-orchestrator")
 
-@dataclass
+_CLOUD_PLATFORM_SCOPES = ("https://www.googleapis.com/auth/cloud-platform",)
+
+def _dumps_payload(payload: Dict[str, Any], indent: bool = True) -> str:
+    """Serialize a job payload to JSON (indented by default), using orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(payload, option=option).decode()
+    return json.dumps(payload, indent=2 if indent else None)
+
+def _dumps_json_line(record: Dict[str, Any]) -> bytes:
+    """Serialize a record to one compact, newline-terminated JSON line, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, separators=(",", ":")) + "\n").encode()
+
+# Every job carries this label so monitor() can fetch the whole experiment's
+# states with a single filtered ListCustomJobs call
+_EXPERIMENT_LABEL = "experiment_name"
+# Slack subtracted from the deploy start time in the ListCustomJobs create_time filter
+_CREATE_TIME_MARGIN = timedelta(minutes=5)
+
+def _label_value(value: str) -> str:
+    """Coerce a string into a valid Vertex AI label value (lowercase, [a-z0-9_-], <= 63 chars)."""
+    return re.sub(r"[^a-z0-9_-]", "-", value.lower())[:63]
+
+# Monitor polling starts fast and backs off towards the caller's poll_interval,
+# dropping back to the initial delay whenever a job changes state.
+# create_custom_job returns the CustomJob itself (no long-running operation to
+# await), so polling with backoff is the cheapest way to catch completions.
+_INITIAL_POLL_DELAY = 5  # seconds
+_POLL_BACKOFF_FACTOR = 1.5
+
+def _check_poll_schedule(min_interval: float, backoff_factor: float) -> None:
+    """Reject monitor() schedules that would collapse into a tight polling loop."""
+    if min_interval <= 0:
+        raise ValueError("min_interval must be positive")
+    if backoff_factor < 1:
+        raise ValueError("backoff_factor must be at least 1")
+
+# Job states after which monitor() stops polling a job. STATUS_ERROR (a failed
+# status fetch) is deliberately absent: such jobs are polled again.
+_TERMINAL_STATES = frozenset({
+    "JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED", "JOB_STATE_CANCELLING",
+})
+
+# Machine type prefixes of the A3 (H100) family, which REQUIRE the AUTOMATIC strategy
+_A3_PREFIXES = ("a3-",)
+
+def _scheduling_for(machine_type: str) -> "Scheduling.Strategy":
+    """Scheduling strategy for a machine type: AUTOMATIC for A3, STANDARD otherwise."""
+    if machine_type.startswith(_A3_PREFIXES):
+        return Scheduling.Strategy.AUTOMATIC  # This is the magic value - do not change!
+    # For other machine types, STANDARD is usually appropriate
+    return Scheduling.Strategy.STANDARD
+
+@functools.lru_cache(maxsize=1)
+def _load_credentials():
+    """
+    Load Application Default Credentials once per process.
+
+    google.auth.default() reads credential files from disk, so callers on the
+    event loop should run this via asyncio.to_thread.
+    """
+    return google.auth.default(scopes=_CLOUD_PLATFORM_SCOPES)
+
+# (project_id, region) the aiplatform SDK globals were last initialized for
+_sdk_initialized_for: Optional[Tuple[str, str]] = None
+
+def _init_sdk(project_id: str, region: str) -> None:
+    """
+    Initialize the aiplatform SDK globals, skipping repeat calls for the same target.
+
+    Only the most recent (project, region) is remembered: aiplatform.init() is
+    process-global, so switching back to an earlier project must re-initialize.
+    """
+    global _sdk_initialized_for
+    if _sdk_initialized_for != (project_id, region):
+        aiplatform.init(project=project_id, location=region)
+        _sdk_initialized_for = (project_id, region)
+
+# Shared job service clients, keyed on (region, credentials, loop, slot)
+_job_clients: Dict[tuple, JobServiceAsyncClient] = {}
+_MAX_JOB_CLIENTS = 64
+# Seconds in-flight RPCs get to finish when an evicted client's channel is closed
+_CHANNEL_CLOSE_GRACE = 30
+_closing_channels: set = set()  # Pending close tasks of evicted clients
+# Upper bound on VertexExperimentConfig.channel_pool_size, well below the cache size
+_MAX_CHANNEL_POOL_SIZE = 16
+# Number of open ``async with VertexOrchestrator(...)`` blocks per event loop
+_client_users: Dict[asyncio.AbstractEventLoop, int] = {}
+
+def _get_job_client(region: str, credentials: Optional[Credentials],
+                    loop: asyncio.AbstractEventLoop, slot: int = 0) -> JobServiceAsyncClient:
+    """
+    Return the shared JobServiceAsyncClient for a region.
+
+    gRPC asyncio channels are bound to the event loop that created them, so the
+    cache is keyed on the running loop as well as the region. Every orchestrator
+    created inside the same ``asyncio.run`` (e.g. a sweep driver invoking the
+    templates repeatedly) reuses one channel instead of opening a new one.
+    Each ``slot`` is a separate client with its own channel and connection
+    (see _create_pooled_channel), for spreading concurrent RPCs over a pool.
+    """
+    key = (region, credentials, loop, slot)
+    client = _job_clients.get(key)
+    if client is None:
+        if len(_job_clients) >= _MAX_JOB_CLIENTS:
+            _evict_job_client()
+        client = _job_clients[key] = JobServiceAsyncClient(
+            credentials=credentials,
+            transport=functools.partial(JobServiceGrpcAsyncIOTransport, channel=_create_pooled_channel),
+            client_options={"api_endpoint": f"{region}-aiplatform.googleapis.com"}
+        )
+    return client
+
+def _evict_job_client() -> None:
+    """
+    Remove the oldest cached client and close its channel on the loop that owns it.
+
+    Clients of loops without open ``async with`` blocks are evicted first. The
+    channel is closed with a grace period, so RPCs still in flight on an
+    evicted client can finish instead of being cancelled.
+    """
+    key = next((key for key in _job_clients if key[2] not in _client_users), next(iter(_job_clients)))
+    client = _job_clients.pop(key)
+    loop = key[2]
+    if loop.is_closed():
+        return  # The channel went down with its loop
+
+    def close() -> None:
+        task = loop.create_task(client.transport.grpc_channel.close(grace=_CHANNEL_CLOSE_GRACE))
+        _closing_channels.add(task)  # Keep a reference until the close completes
+        task.add_done_callback(_closing_channels.discard)
+
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if loop is running:
+        close()
+    else:
+        loop.call_soon_threadsafe(close)
+
+async def _wait_through_cancellation(tasks: Iterable["asyncio.Task[Any]"]) -> None:
+    """
+    Wait for tasks to finish, even if the waiting task is cancelled again meanwhile.
+
+    Only for cleanup paths that are already unwinding a cancellation, which the
+    caller re-raises once the tasks are done.
+    """
+    waiter = asyncio.gather(*tasks, return_exceptions=True)
+    while not waiter.done():
+        try:
+            await asyncio.shield(waiter)
+        except asyncio.CancelledError:
+            pass
+
+def _create_pooled_channel(*args, options=(), **kwargs):
+    """
+    Create a job service gRPC channel with its own subchannel pool.
+
+    Channels with identical arguments otherwise share gRPC's global subchannel
+    pool, and with it a single HTTP/2 connection, so a channel pool would
+    still multiplex every RPC over one connection.
+    """
+    options = [*options, ("grpc.use_local_subchannel_pool", 1)]
+    return JobServiceGrpcAsyncIOTransport.create_channel(*args, options=options, **kwargs)
+
+async def _close_job_clients(loop: asyncio.AbstractEventLoop) -> None:
+    """Close the gRPC channels of every job service client created on ``loop``."""
+    clients = [_job_clients.pop(key) for key in [key for key in _job_clients if key[2] is loop]]
+    results = await asyncio.gather(*(client.transport.close() for client in clients), return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning("Error closing job service channel: %s", result)
+
+@dataclass(frozen=True, slots=True)
 class JobConfig:
     """
     Configuration for a single Vertex AI job deployment.
     
     This defines the hardware specifications, container configuration,
-    and application-specific arguments.
+    and application-specific arguments. Instances are immutable; derive
+    variants (e.g. sweep trials) with dataclasses.replace().
     """
     # --- REQUIRED: Hardware Configuration ---
     machine_type: str  # e.g., "a2-highgpu-1g", "a3-highgpu-8g"
@@ -71,11 +261,12 @@ class JobConfig:
             raise ValueError("accelerator_type must be specified when accelerator_count > 0")
         
         # If accelerator_type is specified but count is 0, set count to 1
+        # (configs are frozen, so this is the one place a field is ever assigned)
         if self.accelerator_type and self.accelerator_count == 0:
-            self.accelerator_count = 1
-            logger.warning(f"accelerator_count was 0 but accelerator_type was specified. Setting count to 1.")
+            object.__setattr__(self, "accelerator_count", 1)
+            logger.warning("accelerator_count was 0 but accelerator_type was specified. Setting count to 1.")
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VertexExperimentConfig:
     """
     Complete configuration for a Vertex AI experiment deployment.
@@ -97,6 +288,29 @@ class VertexExperimentConfig:
     # --- OPTIONAL: Metadata ---
     labels: Dict[str, str] = field(default_factory=dict)  # Global labels for all jobs
 
+    # --- OPTIONAL: Client Configuration ---
+    channel_pool_size: int = 1  # gRPC channels to spread concurrent RPCs over (large sweeps)
+    max_concurrency: int = 16  # Max RPCs in flight per fan-out (respects Vertex API quotas)
+
+    def __post_init__(self):
+        """Validate the configuration."""
+        if not 1 <= self.channel_pool_size <= _MAX_CHANNEL_POOL_SIZE:
+            raise ValueError(f"channel_pool_size must be between 1 and {_MAX_CHANNEL_POOL_SIZE}")
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+# Google Cloud console links for a job; see VertexOrchestrator.get_console_urls()
+_MONITOR_URL_FMT = "https://console.cloud.google.com/vertex-ai/training/{job_id}/locations/{region}?project={project}"
+_LOG_URL_FMT = ("https://console.cloud.google.com/logs/query;query="
+                "resource.type%3D%22aiplatform.googleapis.com%2FCustomJob%22%20"
+                "AND%20resource.labels.custom_job_id%3D%22{job_id}%22?"
+                "project={project}&region={region}")
+
+class JobUrls(NamedTuple):
+    """Google Cloud console links for a deployed job."""
+    monitor: str  # Vertex AI training job page
+    logs: str  # Cloud Logging query for the job's logs
+
 class VertexOrchestrator:
     """
     Manages the deployment, monitoring, and management of Vertex AI experiments.
@@ -108,6 +322,13 @@ class VertexOrchestrator:
     - Monitoring job status
     
     Acts as an abstraction layer over Google Cloud APIs to avoid CLI issues.
+
+    Use it as an async context manager so its resources are released on exit:
+
+        async with VertexOrchestrator(config) as orchestrator:
+            await orchestrator.deploy()
+            async for display_name, status in orchestrator.monitor():
+                ...
     """
 
     def __init__(self, config: VertexExperimentConfig):
@@ -115,75 +336,261 @@ class VertexOrchestrator:
         self.config = config
         self.deployed_jobs = {}
         self.job_statuses = {}
-
-        # Initialize Google Cloud AI Platform client
-        self.client_options = {"api_endpoint": f"{config.region}-aiplatform.googleapis.com"}
-        aiplatform.init(project=config.project_id, location=config.region)
-        self.job_service = aiplatform.gapic.JobServiceClient(client_options=self.client_options)
+        self.deployment_errors = {}  # display name -> submission error message
+        self._creds = None  # Loaded off the event loop by _ensure_creds()
+        self._creds_lock = asyncio.Lock()  # Serializes concurrent first loads (e.g. deploy_and_monitor)
+        self._channel_slots = itertools.cycle(range(config.channel_pool_size))
+        self._active_jobs_count = 0  # Jobs not yet terminal, maintained by monitor()
+        self._snapshot_file = None  # Append-only JSONL status log, opened on first snapshot
+        self._snapshot_jobs_changed = True  # deployed_jobs changed since the last snapshot record
+        self._worker_pool_templates = {}  # Static worker pool spec parts, see _worker_pool_template()
+        self._deployed_queue = None  # Display names of new submissions, while deploy_and_monitor() runs
+        self._deploy_task = None  # deploy() running in the background of deploy_and_monitor()
+        self._deploy_started_at = None  # RFC 3339 lower bound on job create_time, set by deploy()
+        self._console_urls = {}  # resource name -> JobUrls, filled in by get_console_urls()
+
+        # Initialize Google Cloud AI Platform SDK; the job service client itself is
+        # shared per region and created lazily on first use (see _get_job_client)
+        _init_sdk(config.project_id, config.region)
         self.parent = f"projects/{config.project_id}/locations/{config.region}"
 
-        logger.info(f"Initialized VertexOrchestrator for '{config.experiment_name}'")
+        logger.info("Initialized VertexOrchestrator for '%s'", config.experiment_name)
+
+    @property
+    def job_service(self) -> JobServiceAsyncClient:
+        """
+        Async job service client for this orchestrator's region.
+
+        The async client keeps RPCs off the event loop so concurrent submissions
+        and status polls overlap instead of serializing behind blocking calls.
+        Each access returns the next client in the channel pool (round-robin),
+        so concurrent RPCs are spread over config.channel_pool_size channels.
+        Must be accessed from within a running event loop, after _ensure_creds().
+        """
+        return _get_job_client(self.config.region, self._creds, asyncio.get_running_loop(),
+                               next(self._channel_slots))
+
+    async def _ensure_creds(self) -> None:
+        """
+        Load credentials in a worker thread so the first RPC does no blocking disk I/O.
+
+        Concurrent callers share one load: lru_cache does not deduplicate calls
+        already in flight, and separate Credentials objects would key separate
+        clients (and channels) in the client cache.
+        """
+        if self._creds is None:
+            async with self._creds_lock:
+                if self._creds is None:
+                    # The default executor is enough: this is the orchestrator's only
+                    # thread hop (RPCs run on the async client), and it happens once per
+                    # process since _load_credentials is cached
+                    self._creds, _ = await asyncio.to_thread(_load_credentials)
+
+    async def __aenter__(self) -> "VertexOrchestrator":
+        loop = asyncio.get_running_loop()
+        _client_users[loop] = _client_users.get(loop, 0) + 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """
+        Close the status snapshot log, and the job service channels once unused.
+
+        Cancels any submissions still pending from an abandoned deploy_and_monitor() first.
+
+        Clients are shared by every orchestrator on the event loop, so their
+        gRPC channels are only closed when the last ``async with`` block on the
+        loop exits; a concurrent sweep keeps its connection until it finishes.
+        """
+        # A deploy_and_monitor() abandoned mid-iteration may still be submitting
+        if self._deploy_task is not None:
+            self._deploy_task.cancel()
+            await asyncio.wait([self._deploy_task])
+            self._deploy_task = None
+
+        self._close_snapshot_log()
+
+        loop = asyncio.get_running_loop()
+        _client_users[loop] -= 1
+        if not _client_users[loop]:
+            del _client_users[loop]
+            await _close_job_clients(loop)
 
     async def deploy(self) -> Dict[str, str]:
         """
         Deploy all jobs for this experiment.
 
+        Jobs are submitted concurrently, at most config.max_concurrency at a
+        time. Submissions that fail are marked DEPLOYMENT_FAILED in
+        job_statuses and their errors recorded in deployment_errors.
+
         Returns:
             Dictionary mapping job display names to resource names
         """
-        logger.info(f"Deploying experiment '{self.config.experiment_name}' with {len(self.config.jobs)} jobs")
+        logger.info("Deploying experiment '%s' with %s jobs", self.config.experiment_name, len(self.config.jobs))
+        if self._deploy_started_at is None:
+            # Allow for clock skew between this machine and Vertex AI
+            started_at = datetime.now(timezone.utc) - _CREATE_TIME_MARGIN
+            self._deploy_started_at = started_at.strftime('%Y-%m-%dT%H:%M:%SZ')
+        await self._ensure_creds()
+
+        # Resolve display names once and submit jobs concurrently (at most
+        # max_concurrency in flight), so N submissions cost ~N/max_concurrency
+        # round-trips instead of N without bursting past API quotas
+        display_names = [
+            job_config.display_name or f"{self.config.experiment_name}-job-{i+1}"
+            for i, job_config in enumerate(self.config.jobs)
+        ]
+        total = len(display_names)
+        progress_step = max(1, total // 10)  # Log progress roughly every 10%
+
+        # Each JobConfig is deliberately its own CustomJob: the worker pools of a
+        # single CustomJob form one distributed job (at most 4 pools, sharing a
+        # lifecycle that ends when pool 0 exits), so packing independent jobs
+        # into one would cancel or fail them together.
+        tasks = self._bounded_tasks(
+            self._submit_job(job_config, display_name)
+            for job_config, display_name in zip(self.config.jobs, display_names)
+        )
+
+        # Each outcome is recorded by _submit_job as soon as its RPC returns;
+        # consume them in completion order so progress shows while slow
+        # submissions are still in flight
+        success_count = 0
+        try:
+            for finished, next_result in enumerate(asyncio.as_completed(tasks), 1):
+                if await next_result:
+                    success_count += 1
+                if finished % progress_step == 0 and finished < total:
+                    logger.info("Deployment progress: %s/%s submissions finished (%s succeeded)",
+                                finished, total, success_count)
+        finally:
+            # If deploy() is cancelled, drop submissions still waiting for a slot
+            # and wait for the create RPCs already sent (see _submit_job)
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await _wait_through_cancellation(pending)
+
+        logger.info("Experiment deployment submission complete: %s/%s jobs submitted.",
+                    success_count, total)
+        return self.deployed_jobs
 
-        tasks = []
-        for i, job_config in enumerate(self.config.jobs):
-            display_name = job_config.display_name or f"{self.config.experiment_name}-job-{i+1}"
-            tasks.append(self._deploy_job(job_config, display_name))
+    async def _submit_job(self, job_config: JobConfig, display_name: str) -> bool:
+        """
+        Deploy one job and record the outcome as soon as it is known.
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        Successful submissions are also handed to a running deploy_and_monitor(),
+        so they are polled without waiting for the rest of the experiment.
+        Returns True if the job was submitted.
+        """
+        submission = asyncio.create_task(self._deploy_job(job_config, display_name))
+        submission.add_done_callback(functools.partial(self._record_submission, display_name))
+        try:
+            await asyncio.shield(submission)
+        except asyncio.CancelledError:
+            # The create RPC may already have reached Vertex: let it finish, so a
+            # job created server-side is recorded (and cancellable) instead of orphaned
+            await _wait_through_cancellation([submission])
+            raise
+        except Exception:
+            return False
+        return True
+
+    def _record_submission(self, display_name: str, submission: "asyncio.Task[str]") -> None:
+        """Record a finished _deploy_job() outcome in deployed_jobs or deployment_errors."""
+        if submission.cancelled():
+            return
+        error = submission.exception()
+        if error is not None:
+            logger.error("Failed to deploy job %s: %s", display_name, error)
+            self.job_statuses[display_name] = "DEPLOYMENT_FAILED"
+            self.deployment_errors[display_name] = str(error)
+            return
+
+        job_resource_name = submission.result()
+        logger.info("Successfully submitted job %s: %s", display_name, job_resource_name)
+        self.deployed_jobs[display_name] = job_resource_name
+        self.job_statuses[display_name] = "SUBMITTED"
+        self._snapshot_jobs_changed = True
+        if self._deployed_queue is not None:
+            self._deployed_queue.put_nowait(display_name)
+
+    def _bounded_tasks(self, coros: Iterable[Coroutine[Any, Any, Any]]) -> List["asyncio.Task[Any]"]:
+        """Schedule coroutines as tasks, with at most config.max_concurrency running at a time."""
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def run(coro: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await coro
 
-        success_count = 0
-        for i, result in enumerate(results):
-            job_config = self.config.jobs[i]
-            display_name = job_config.display_name or f"{self.config.experiment_name}-job-{i+1}"
-            if isinstance(result, Exception):
-                logger.error(f"Failed to deploy job {display_name}: {result}")
-                self.job_statuses[display_name] = "DEPLOYMENT_FAILED"
-            else:
-                job_resource_name = result
-                logger.info(f"Successfully submitted job {display_name}: {job_resource_name}")
-                self.deployed_jobs[display_name] = job_resource_name
-                self.job_statuses[display_name] = "SUBMITTED"
-                success_count += 1
+        tasks = []
+        for coro in coros:
+            task = asyncio.create_task(run(coro))
+            # A task cancelled before it starts never awaits coro; close it quietly
+            task.add_done_callback(lambda _, coro=coro: coro.close())
+            tasks.append(task)
+        return tasks
+
+    async def _gather_bounded(self, coros: Iterable[Coroutine[Any, Any, Any]]) -> List[Any]:
+        """
+        Await coroutines concurrently with at most config.max_concurrency in flight.
 
-        logger.info(f"Experiment deployment submission complete: {success_count}/{len(self.config.jobs)} jobs submitted.")
-        return self.deployed_jobs
+        Like asyncio.gather(..., return_exceptions=True): results keep the input
+        order and exceptions are returned in place of results.
+        """
+        return await asyncio.gather(*self._bounded_tasks(coros), return_exceptions=True)
 
-    async def _deploy_job(self, job_config: JobConfig, display_name: str) -> str:
-        """Deploy a single job using Google Cloud AI Platform Python client."""
-        custom_job_payload = {}  # Initialize payload dict for error logging
-        try:
-            # --- Construct Job Request ---
-            worker_pool_spec = {
+    def _worker_pool_template(self, job_config: JobConfig) -> Dict[str, Any]:
+        """
+        Worker pool spec for a job, without its container args.
+
+        Templates are cached per machine/accelerator/env signature, so a sweep of
+        N jobs builds the machine spec and env list once rather than N times.
+        The returned dict (and its nested dicts) is shared: copy, do not mutate.
+        """
+        env_items = tuple(job_config.container_env.items()) if job_config.container_env else ()
+        key = (job_config.machine_type, job_config.accelerator_type, job_config.accelerator_count, env_items)
+        template = self._worker_pool_templates.get(key)
+        if template is None:
+            template = {
                 "machine_spec": {
                     "machine_type": job_config.machine_type,
                 },
                 "replica_count": 1,
                 "container_spec": {
                     "image_uri": self.config.image_uri,
-                    "args": job_config.container_args
                 }
             }
 
             # Add environment variables if specified
-            if job_config.container_env:
-                env_list = []
-                for key, value in job_config.container_env.items():
-                    env_list.append({"name": key, "value": value})
-                worker_pool_spec["container_spec"]["env"] = env_list
+            if env_items:
+                template["container_spec"]["env"] = [{"name": name, "value": value} for name, value in env_items]
 
             # Add accelerator config if GPU is requested
             if job_config.accelerator_type and job_config.accelerator_count > 0:
-                worker_pool_spec["machine_spec"]["accelerator_type"] = job_config.accelerator_type
-                worker_pool_spec["machine_spec"]["accelerator_count"] = job_config.accelerator_count
+                template["machine_spec"]["accelerator_type"] = job_config.accelerator_type
+                template["machine_spec"]["accelerator_count"] = job_config.accelerator_count
+
+            self._worker_pool_templates[key] = template
+        return template
+
+    async def _deploy_job(self, job_config: JobConfig, display_name: str) -> str:
+        """
+        Deploy a single job using the Google Cloud AI Platform async client.
+
+        The create RPC is awaited rather than run on a thread, so deploy() can
+        overlap any number of submissions on the event loop.
+        """
+        custom_job_payload = {}  # Initialize payload dict for error logging
+        try:
+            # --- Construct Job Request ---
+            # Only the container args differ between jobs of a sweep; the rest of
+            # the worker pool spec is shared with every job of the same shape
+            template = self._worker_pool_template(job_config)
+            worker_pool_spec = {
+                **template,
+                "container_spec": {**template["container_spec"], "args": job_config.container_args},
+            }
 
             # Create the basic job payload
             custom_job_payload = {
@@ -202,18 +609,10 @@ class VertexOrchestrator:
 
             # --- CRITICAL: Add Scheduling Strategy Based on Machine Type ---
             # Different machine types require different scheduling strategies
-            if job_config.machine_type.startswith("a3-"):
-                # A3 machines (H100) REQUIRE the AUTOMATIC strategy
-                logger.info(f"Machine type {job_config.machine_type} is A3 (H100), setting scheduling strategy to AUTOMATIC.")
-                custom_job_payload["job_spec"]["scheduling"] = {
-                    "strategy": Scheduling.Strategy.AUTOMATIC  # This is the magic value - do not change!
-                }
-            else:
-                # For other machine types, STANDARD is usually appropriate
-                logger.info(f"Machine type {job_config.machine_type} is not A3, setting scheduling strategy to STANDARD.")
-                custom_job_payload["job_spec"]["scheduling"] = {
-                    "strategy": Scheduling.Strategy.STANDARD
-                }
+            strategy = _scheduling_for(job_config.machine_type)
+            custom_job_payload["job_spec"]["scheduling"] = {"strategy": strategy}
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Machine type %s: scheduling strategy %s", job_config.machine_type, strategy)
 
             # Add service account if specified
             if job_config.service_account:
@@ -223,16 +622,24 @@ class VertexOrchestrator:
             if job_config.network:
                 custom_job_payload["job_spec"]["network"] = job_config.network
 
-            # Add labels (merge global and job-specific)
-            all_labels = {**self.config.labels, **job_config.labels}
-            if all_labels:
-                custom_job_payload["labels"] = all_labels
+            # Add labels (merge global and job-specific); the experiment label is
+            # always set last because monitor() filters on it
+            custom_job_payload["labels"] = {
+                **self.config.labels,
+                **job_config.labels,
+                _EXPERIMENT_LABEL: _label_value(self.config.experiment_name),
+            }
 
             # --- Submit Job ---
-            logger.info(f"Submitting job {display_name} with payload: {json.dumps(custom_job_payload, indent=2)}")
-
-            # Use the REST API directly via the client
-            response = self.job_service.create_custom_job(
+            # Only pay for serializing the payload when it will actually be logged;
+            # the full indented payload is still logged if submission fails
+            logger.info("Submitting job %s", display_name)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Submitting job %s with payload: %s",
+                             display_name, _dumps_payload(custom_job_payload, indent=False))
+
+            # Submit via the async client so other submissions proceed concurrently
+            response = await self.job_service.create_custom_job(
                 parent=self.parent,
                 custom_job=custom_job_payload
             )
@@ -240,127 +647,285 @@ class VertexOrchestrator:
             return response.name
 
         except Exception as e:
-            logger.exception(f"Error deploying job {display_name}")
+            logger.exception("Error deploying job %s", display_name)
             # Log the payload that failed
             try:
-                failed_payload_json = json.dumps(custom_job_payload, indent=2)
-                logger.error(f"Failed payload for {display_name}: {failed_payload_json}")
+                failed_payload_json = _dumps_payload(custom_job_payload)
+                logger.error("Failed payload for %s: %s", display_name, failed_payload_json)
             except Exception as json_err:
-                logger.error(f"Could not serialize failed payload for {display_name}: {json_err}")
+                logger.error("Could not serialize failed payload for %s: %s", display_name, json_err)
             raise e  # Re-raise the original exception
 
-    async def monitor(self, poll_interval: int = 60) -> Dict[str, str]:
+    async def monitor(self, poll_interval: float = 60, min_interval: float = _INITIAL_POLL_DELAY,
+                      backoff_factor: float = _POLL_BACKOFF_FACTOR) -> AsyncIterator[Tuple[str, str]]:
         """
-        Monitor all deployed jobs until completion.
+        Monitor all deployed jobs until completion, yielding each job as it finishes.
+
+        Polls start min_interval apart and back off exponentially up to
+        poll_interval while nothing changes; any job state transition resets
+        the interval to min_interval, so bursts of completions (and jobs that
+        finish early) are noticed within seconds. Callers can react to
+        (or stop on) each completion without waiting for the slowest job; the
+        latest state of every job is kept in job_statuses.
 
         Args:
-            poll_interval: How often to poll for status updates (seconds)
+            poll_interval: Maximum time between status polls (seconds)
+            min_interval: Time between polls after a state change (seconds)
+            backoff_factor: Growth of the interval per poll without changes
             
-        Returns:
-            Dictionary of job display names to final status
+        Yields:
+            (display_name, status) tuples as jobs reach a terminal state
         """
+        _check_poll_schedule(min_interval, backoff_factor)
         if not self.deployed_jobs:
             logger.warning("No jobs have been deployed to monitor")
-            return {}  # Return empty dict if no jobs
+            return
 
-        logger.info(f"Starting monitor for {len(self.deployed_jobs)} jobs...")
-        active_jobs = set(self.deployed_jobs.keys())
+        logger.info("Starting monitor for %s jobs...", len(self.deployed_jobs))
+        async for display_name, status in self._monitor_jobs(set(self.deployed_jobs), poll_interval,
+                                                             min_interval, backoff_factor):
+            yield display_name, status
 
-        while active_jobs:
-            logger.info(f"Polling status for {len(active_jobs)} active jobs...")
-            completed_in_poll = set()
+    async def deploy_and_monitor(self, poll_interval: float = 60, min_interval: float = _INITIAL_POLL_DELAY,
+                                 backoff_factor: float = _POLL_BACKOFF_FACTOR) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Deploy all jobs and monitor them while the rest are still being submitted.
+
+        Equivalent to deploy() followed by monitor(), except that each job is
+        polled from the moment its own submission succeeds, so the first jobs
+        of a large experiment are not left unwatched until the last one is in.
+        If iteration stops early (the generator is closed, the consumer is
+        cancelled, or the orchestrator's ``async with`` block exits first),
+        submissions still waiting for a slot are dropped. Create RPCs already
+        sent are allowed to finish and recorded in deployed_jobs, so
+        cancel_all() can still reach every job that was created.
+
+        Args:
+            poll_interval, min_interval, backoff_factor: Polling schedule, as for monitor()
+
+        Yields:
+            (display_name, status) tuples as jobs reach a terminal state
+        """
+        _check_poll_schedule(min_interval, backoff_factor)
+        submitted = self._deployed_queue = asyncio.Queue()
+        deploy_task = self._deploy_task = asyncio.create_task(self.deploy())
+        deploy_task.add_done_callback(lambda _: submitted.put_nowait(None))  # End of submissions
+        finished = False
+        try:
+            async for display_name, status in self._monitor_jobs(set(), poll_interval, min_interval,
+                                                                 backoff_factor, submitted):
+                yield display_name, status
+            finished = True
+        finally:
+            self._deployed_queue = None
+            self._deploy_task = None
+            if not finished:
+                deploy_task.cancel()  # deploy() cancels its pending submissions in turn
+                await asyncio.wait([deploy_task])
+        await deploy_task  # Already done; re-raises anything deploy() raised
+
+    async def _monitor_jobs(self, active_jobs: set, poll_interval: float, min_interval: float,
+                            backoff_factor: float, submitted: Optional[asyncio.Queue] = None) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Poll active_jobs until they all reach a terminal state, yielding each as it finishes.
 
-            for display_name in list(active_jobs):  # Iterate over a copy
-                resource_name = self.deployed_jobs[display_name]
-                try:
-                    # Get job status using the client API
-                    job_status_obj = self.job_service.get_custom_job(name=resource_name)
-                    status = job_status_obj.state.name  # Get the string representation
+        If a submitted queue is given, display names arriving on it join
+        active_jobs and polling continues until a None marks the end of
+        submission.
+        """
+        await self._ensure_creds()
+        self._active_jobs_count = len(active_jobs)
+        min_interval = min(min_interval, poll_interval)
+        delay = min_interval
+        submitting = submitted is not None
+
+        # All active jobs share one poll schedule rather than per-job timers:
+        # a poll is a single ListCustomJobs call that returns every job's state
+        # at once, so polling one job costs the same RPC as polling all of them,
+        # and the shared interval already drops back on any job's transition.
+        try:
+            while active_jobs or submitting:
+                # Pick up jobs submitted since the last poll, waiting for one if idle
+                while submitting and (not active_jobs or not submitted.empty()):
+                    display_name = await submitted.get()
+                    if display_name is None:
+                        submitting = False
+                    else:
+                        active_jobs.add(display_name)
+                        self._active_jobs_count += 1
+                if not active_jobs:
+                    break  # Nothing was submitted successfully
+
+                logger.info("Polling status for %s active jobs...", len(active_jobs))
+                completed_in_poll = set()
+                changed = False
+
+                statuses = await self._poll_statuses(active_jobs)
+                for display_name, status in statuses.items():
+                    if status != self.job_statuses.get(display_name) and status != "STATUS_ERROR":
+                        changed = True
                     self.job_statuses[display_name] = status
 
                     # Check if this job is now complete
-                    if status in ["JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", 
-                                  "JOB_STATE_EXPIRED", "JOB_STATE_CANCELLING"]:
-                        logger.info(f"Job {display_name} finished or finishing with status: {status}")
+                    if status in _TERMINAL_STATES:
+                        logger.info("Job %s finished or finishing with status: %s", display_name, status)
                         completed_in_poll.add(display_name)
+                        yield display_name, status
                     elif status == "JOB_STATE_UPDATING":
-                        logger.info(f"Job {display_name} is currently updating.")
-                    # Otherwise job is still active
-
-                except Exception as e:
-                    logger.error(f"Error getting status for job {display_name} ({resource_name}): {e}")
-                    self.job_statuses[display_name] = "STATUS_ERROR"
+                        logger.info("Job %s is currently updating.", display_name)
+                    # Otherwise job is still active (or its status could not be fetched)
+
+                # Remove completed jobs from the active set
+                active_jobs -= completed_in_poll
+                self._active_jobs_count -= len(completed_in_poll)
+
+                # Save status snapshot
+                self._save_status_snapshot()
+
+                # Wait before next poll if jobs are still active; poll again soon
+                # after any transition, back off while nothing changes
+                if active_jobs:
+                    if changed:
+                        delay = min_interval
+                    logger.info("%s jobs still active. Waiting %.0fs...", len(active_jobs), delay)
+                    await asyncio.sleep(delay)
+                    delay = min(poll_interval, delay * backoff_factor)
+
+            logger.info("All jobs have completed or reached a terminal state.")
+        finally:
+            # The log is reopened by the next monitor run; do not leave it to __aexit__
+            self._close_snapshot_log()
+
+    async def _poll_statuses(self, display_names: Iterable[str]) -> Dict[str, str]:
+        """
+        Fetch the current state of the given deployed jobs.
 
-            # Remove completed jobs from the active set
-            active_jobs -= completed_in_poll
+        A single ListCustomJobs call filtered on the experiment label (and deploy
+        time) returns every job of this run, replacing one GetCustomJob per job per
+        poll. Jobs
+        missing from the listing fall back to individual GetCustomJob calls,
+        issued concurrently.
 
-            # Save status snapshot
-            self._save_status_snapshot()
+        Returns:
+            Dictionary of job display names to state names ("STATUS_ERROR" on failure)
+        """
+        try:
+            listed = await self._list_experiment_job_states()
+        except Exception as e:
+            logger.warning("Error listing jobs for experiment '%s', falling back to per-job polling: %s",
+                           self.config.experiment_name, e)
+            listed = {}
+
+        statuses = {}
+        missing = []
+        for display_name in display_names:
+            status = listed.get(self.deployed_jobs[display_name])
+            if status is None:
+                missing.append(display_name)
+            else:
+                statuses[display_name] = status
+
+        # Fetch any jobs the listing did not cover concurrently rather than one by one
+        results = await self._gather_bounded(
+            self.job_service.get_custom_job(name=self.deployed_jobs[display_name])
+            for display_name in missing
+        )
+        for display_name, result in zip(missing, results):
+            if isinstance(result, Exception):
+                logger.error("Error getting status for job %s (%s): %s",
+                             display_name, self.deployed_jobs[display_name], result)
+                statuses[display_name] = "STATUS_ERROR"
+            else:
+                statuses[display_name] = result.state.name  # Get the string representation
+        return statuses
 
-            # Wait before next poll if jobs are still active
-            if active_jobs:
-                logger.info(f"{len(active_jobs)} jobs still active. Waiting {poll_interval}s...")
-                await asyncio.sleep(poll_interval)
+    async def _list_experiment_job_states(self) -> Dict[str, str]:
+        """
+        Return the state name of every job carrying this experiment's label, keyed by resource name.
 
-        logger.info("All jobs have completed or reached a terminal state.")
-        return self.job_statuses
+        Experiment names may be reused across runs, so the listing is limited to
+        jobs created since this orchestrator's first deploy(); otherwise every
+        poll would page through all historical jobs of the experiment. Without a
+        deploy() (e.g. deployed_jobs filled in by hand) all labelled jobs are listed.
+        """
+        experiment_label = _label_value(self.config.experiment_name)
+        job_filter = f'labels.{_EXPERIMENT_LABEL}="{experiment_label}"'
+        if self._deploy_started_at is not None:
+            job_filter += f' AND create_time>="{self._deploy_started_at}"'
+        pager = await self.job_service.list_custom_jobs(request={
+            "parent": self.parent,
+            "filter": job_filter,
+            "read_mask": {"paths": ["name", "state"]},
+        })
+        return {job.name: job.state.name async for job in pager}
+
+    def _close_snapshot_log(self) -> None:
+        """Close the status log, if open."""
+        if self._snapshot_file is not None:
+            self._snapshot_file.close()
+            self._snapshot_file = None
 
     def _save_status_snapshot(self) -> None:
-        """Save a snapshot of current job statuses to file."""
-        try:
-            # Ensure status directory exists
-            status_dir = "status_snapshots"  # Relative path is fine for local execution
-            os.makedirs(status_dir, exist_ok=True)
-            snapshot_file = os.path.join(status_dir, f"{self.config.experiment_name}_status_{time.strftime('%Y%m%d_%H%M%S')}.json")
+        """
+        Append a snapshot of current job statuses to the experiment's status log.
 
+        Each poll appends one compact JSON line to
+        status_snapshots/<experiment_name>_status.jsonl. Resource names are only
+        written when jobs have been (re)deployed since the previous record.
+        """
+        try:
+            if self._snapshot_file is None:
+                status_dir = "status_snapshots"  # Relative path is fine for local execution
+                os.makedirs(status_dir, exist_ok=True)
+                snapshot_path = os.path.join(status_dir, f"{self.config.experiment_name}_status.jsonl")
+                # Unbuffered: each record is a single write() that reaches the file immediately
+                self._snapshot_file = open(snapshot_path, "ab", buffering=0)
+                self._snapshot_jobs_changed = True  # Each run's first record names its jobs
+
+            now = datetime.now(timezone.utc)  # One clock read for both timestamps
             snapshot = {
-                "experiment_name": self.config.experiment_name,
-                "timestamp": time.time(),
-                "timestamp_iso": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                "timestamp": now.timestamp(),
+                "timestamp_iso": now.strftime('%Y-%m-%dT%H:%M:%SZ'),
                 "job_statuses": self.job_statuses,
-                "deployed_jobs": self.deployed_jobs,  # Include resource names
                 "total_jobs": len(self.deployed_jobs),
-                "active_jobs_count": len([status for status in self.job_statuses.values() 
-                                       if status not in ["JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED",
-                                                        "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED",
-                                                        "JOB_STATE_CANCELLING", "STATUS_ERROR"]])
+                "active_jobs_count": self._active_jobs_count,
             }
+            if self._snapshot_jobs_changed:
+                snapshot["deployed_jobs"] = self.deployed_jobs  # Include resource names
+                self._snapshot_jobs_changed = False
 
-            with open(snapshot_file, "w") as f:
-                json.dump(snapshot, f, indent=2)
-            logger.debug(f"Status snapshot saved to {snapshot_file}")
+            self._snapshot_file.write(_dumps_json_line(snapshot))
+            logger.debug("Status snapshot appended to %s", self._snapshot_file.name)
 
         except Exception as e:
-            logger.error(f"Error saving status snapshot: {e}")
+            logger.error("Error saving status snapshot: %s", e)
 
-    def get_console_urls(self) -> Dict[str, Dict[str, str]]:
+    def get_console_urls(self) -> Dict[str, JobUrls]:
         """
         Get console URLs for all deployed jobs.
         
         Returns:
-            Dictionary of job display names to URLs
+            Dictionary of job display names to JobUrls (monitor and logs links)
         """
+        # URLs are built once per resource name, so a redeploy that gives a
+        # display name a new job gets fresh links
+        cache = self._console_urls
         urls = {}
         for display_name, resource_name in self.deployed_jobs.items():
-            # Extract job ID
-            job_id_part = resource_name.split('/')[-1]
-            
-            # Generate console URLs
-            monitor_url = (f"https://console.cloud.google.com/vertex-ai/training/"
-                          f"{job_id_part}/locations/{self.config.region}?project={self.config.project_id}")
-            log_url = (f"https://console.cloud.google.com/logs/query;query="
-                      f"resource.type%3D%22aiplatform.googleapis.com%2FCustomJob%22%20"
-                      f"AND%20resource.labels.custom_job_id%3D%22{job_id_part}%22?"
-                      f"project={self.config.project_id}&region={self.config.region}")
-            
-            urls[display_name] = {
-                "monitor": monitor_url,
-                "logs": log_url
-            }
-        
+            job_urls = cache.get(resource_name)
+            if job_urls is None:
+                job_id = resource_name.rpartition('/')[2]
+                job_urls = cache[resource_name] = JobUrls(
+                    monitor=_MONITOR_URL_FMT.format(job_id=job_id, region=self.config.region,
+                                                    project=self.config.project_id),
+                    logs=_LOG_URL_FMT.format(job_id=job_id, region=self.config.region,
+                                             project=self.config.project_id),
+                )
+            urls[display_name] = job_urls
+
         return urls
-    
-    def cancel_job(self, display_name: str) -> bool:
+
+    async def cancel_job(self, display_name: str) -> bool:
         """
         Cancel a running job.
         
@@ -371,14 +936,34 @@ class VertexOrchestrator:
             True if cancel request was successful, False otherwise
         """
         if display_name not in self.deployed_jobs:
-            logger.error(f"Job {display_name} not found in deployed jobs")
+            logger.error("Job %s not found in deployed jobs", display_name)
             return False
         
         resource_name = self.deployed_jobs[display_name]
         try:
-            self.job_service.cancel_custom_job(name=resource_name)
-            logger.info(f"Requested cancellation of job {display_name}")
+            await self._ensure_creds()
+            await self.job_service.cancel_custom_job(name=resource_name)
+            logger.info("Requested cancellation of job %s", display_name)
             return True
         except Exception as e:
-            logger.error(f"Error cancelling job {display_name}: {e}")
+            logger.error("Error cancelling job %s: %s", display_name, e)
             return False
+
+    async def cancel_all(self) -> Dict[str, bool]:
+        """
+        Cancel every deployed job that is not already known to be finished.
+
+        Cancel requests are sent concurrently (at most config.max_concurrency
+        at a time), so tearing down an experiment takes a few round-trips
+        rather than one per job.
+
+        Returns:
+            Dictionary of job display names to whether the cancel request was successful
+        """
+        display_names = [
+            display_name for display_name in self.deployed_jobs
+            if self.job_statuses.get(display_name) not in _TERMINAL_STATES
+        ]
+        logger.info("Cancelling %s jobs of experiment '%s'", len(display_names), self.config.experiment_name)
+        results = await self._gather_bounded(self.cancel_job(display_name) for display_name in display_names)
+        return {display_name: result is True for display_name, result in zip(display_names, results)}